@@ -9,6 +9,8 @@ Prerequisites:
         --scopes=https://www.googleapis.com/auth/drive.readonly,https://www.googleapis.com/auth/cloud-platform
     export CLICKUP_API_TOKEN=pk_xxx
 
+    Optional: pip install orjson (faster JSON; stdlib json is used without it)
+
 Usage:
     python scripts/backfill-standup-notes.py --dry-run
     python scripts/backfill-standup-notes.py
@@ -17,16 +19,34 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import atexit
+import codecs
+import email
+import functools
+import hashlib
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import random
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import quote, urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used without it
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Defaults (match n8n workflow: meet-standup-to-clickup.json)
@@ -38,13 +58,257 @@ DEFAULT_PARENT_TYPE = 4            # Space
 DEFAULT_NAME_FILTER = "Daily Standup and Checkin"
 
 DRIVE_API = "https://www.googleapis.com/drive/v3"
+DRIVE_BATCH_URL = "https://www.googleapis.com/batch/drive/v3"
 CLICKUP_DOCS_URL = "https://api.clickup.com/api/v3/workspaces/{workspace}/docs"
 STATE_FILE = Path.home() / ".cache" / "standup-backfill-state.json"
+STATE_LOG = Path.home() / ".cache" / "standup-backfill-state.log"
+TOKEN_CACHE_FILE = Path.home() / ".cache" / "standup-backfill-token.json"
 ADC_FILE = Path.home() / ".config" / "gcloud" / "application_default_credentials.json"
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 
-# ClickUp rate limit: 100 req/min → 0.6s between requests
-RATE_LIMIT_DELAY = 0.6
+# ClickUp token read from 1Password, cached briefly so back-to-back runs of
+# these scripts spawn `op` once (shared with fix-existing-standup-docs.py)
+CLICKUP_TOKEN_CACHE = Path.home() / ".cache" / "clickup-token"
+CLICKUP_TOKEN_TTL = 600
+
+# Google only gzips responses when the User-Agent also contains "gzip"
+USER_AGENT = "standup-backfill/1.0 (gzip)"
+
+# ClickUp rate limit: 100 req/min. Budget 95/min with a small burst so that
+# no 60s window can exceed 100 requests.
+CLICKUP_CALLS_PER_MINUTE = 95
+CLICKUP_BURST = 5
+
+# ClickUp writers run concurrently. Pacing is shared across all of them,
+# so this overlaps request latency, not the rate limit. Enough are needed
+# to keep the 95/min budget busy while others wait on responses.
+MAX_WORKERS = 10
+
+# Drive exports run ahead of the ClickUp writers in their own pool. Drive
+# quotas are far higher than ClickUp's, so exports are not rate-limited;
+# the queue bounds how many formatted docs wait for a writer. An export
+# worker blocked on a full queue still holds the rest of its batch, so at
+# most EXPORT_QUEUE_SIZE + EXPORT_WORKERS * DRIVE_BATCH_SIZE exported docs
+# are in memory at once (a few MB at standup-notes sizes).
+EXPORT_WORKERS = 16
+EXPORT_QUEUE_SIZE = 32
+
+# Docs per Drive batch request (Drive's maximum is 100 sub-requests)
+DRIVE_BATCH_SIZE = 100
+
+# Bytes read per chunk when streaming a single-doc export
+EXPORT_CHUNK_SIZE = 256 * 1024
+
+# Retries for 429/5xx: exponential backoff from 2s, capped at 32s, with up
+# to 50% jitter on top (2, 4, 8, 16, 32s). The five retries take at least
+# 62s, so a throttled call outlasts ClickUp's 60s rate-limit window even
+# without an X-RateLimit-Reset header; with one, a 429 waits for the reset
+# (at most RATE_LIMIT_RESET_MAX seconds).
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 2
+RETRY_BACKOFF_MAX = 32
+RATE_LIMIT_RESET_MAX = 65
+
+
+# ---------------------------------------------------------------------------
+# Logging
+# ---------------------------------------------------------------------------
+
+log = logging.getLogger("standup-backfill")
+
+
+def configure_logging() -> None:
+    """Send INFO to stdout and WARNING and above to stderr.
+
+    Records are queued and written by a background listener thread, so
+    worker threads never block on formatting or terminal I/O.
+    """
+    if log.handlers:
+        return
+
+    formatter = logging.Formatter("%(asctime)s %(message)s", datefmt="%H:%M:%S")
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(formatter)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(formatter)
+    stderr_handler.setLevel(logging.WARNING)
+
+    records: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(
+        records, stdout_handler, stderr_handler, respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    log.addHandler(logging.handlers.QueueHandler(records))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+# ---------------------------------------------------------------------------
+# JSON (orjson when installed)
+# ---------------------------------------------------------------------------
+
+def _json_loads(data: bytes | str):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: object, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+class RateLimiter:
+    """Thread-safe token bucket shared by all ClickUp calls.
+
+    Tokens refill continuously at ``calls`` per ``period`` seconds, up to
+    ``burst``. A call only sleeps when the bucket is empty, so time already
+    spent waiting on responses counts towards the budget. Callers may drive
+    the balance negative; each one then sleeps until its own slot.
+    """
+
+    def __init__(self, calls: int, period: float, burst: int) -> None:
+        self._rate = calls / period
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._rate,
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+_clickup_limiter = RateLimiter(CLICKUP_CALLS_PER_MINUTE, 60, CLICKUP_BURST)
+
+
+# ---------------------------------------------------------------------------
+# HTTP sessions
+# ---------------------------------------------------------------------------
+
+class _JitteredRetry(Retry):
+    """Retry 429 and 5xx with exponential backoff and upward jitter.
+
+    Unlike urllib3's default schedule, the first retry waits too. A
+    ``Retry-After`` header still takes precedence; failing that, a 429
+    waits for ClickUp's ``X-RateLimit-Reset``. A 429 is retried for any
+    method, since a throttled request was never processed (so even the
+    create-doc POST is safe to resend).
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_backoff_time(self) -> float:
+        # history already holds the failure being retried
+        base = self.backoff_factor * 2 ** max(len(self.history) - 1, 0)
+        return min(RETRY_BACKOFF_MAX, base) * random.uniform(1, 1.5)
+
+    def sleep(self, response=None) -> None:
+        if (
+            response is not None
+            and response.status == 429
+            and "Retry-After" not in response.headers
+        ):
+            wait = _rate_limit_reset_wait(response.headers.get("X-RateLimit-Reset"))
+            if wait is not None:
+                time.sleep(wait)
+                return
+        super().sleep(response)
+
+
+class _ClickUpRetry(_JitteredRetry):
+    """Also take a rate-limiter token before each retry, so retries are
+    paced with every other ClickUp call instead of bypassing the budget.
+    """
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        _clickup_limiter.acquire()
+
+
+def _rate_limit_reset_wait(reset: str | None) -> float | None:
+    """Seconds until the rate-limit window in ``X-RateLimit-Reset`` resets."""
+    try:
+        reset_at = float(reset)
+    except (TypeError, ValueError):
+        return None
+    if reset_at > 1e11:  # Milliseconds rather than seconds
+        reset_at /= 1000
+    wait = reset_at - time.time()
+    if wait <= 0:
+        return None
+    return min(wait, RATE_LIMIT_RESET_MAX) + random.uniform(0, 1)
+
+
+def _make_session(
+    headers: dict[str, str],
+    pool_size: int,
+    retry_cls: type[Retry] = _JitteredRetry,
+) -> requests.Session:
+    """Build a session that keeps connections alive and retries transient errors.
+
+    One session per API means one TLS handshake per pooled connection
+    instead of one per request.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", _make_adapter(pool_size, retry_cls))
+    return session
+
+
+def _make_adapter(pool_size: int, retry_cls: type[Retry] = _JitteredRetry) -> HTTPAdapter:
+    """Connection pool sized to the threads sharing it.
+
+    The pool blocks when exhausted, so extra concurrency waits for a warm
+    connection instead of opening one-off sockets. Server errors (5xx) are
+    retried for idempotent methods only, so a ClickUp doc is never created
+    twice; 429s are retried for every method (see ``_JitteredRetry``).
+    The final response is returned rather than raised, so callers still
+    get ``requests.HTTPError`` from ``raise_for_status()``.
+    """
+    retry = retry_cls(
+        total=RETRY_ATTEMPTS,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+
+_drive_session = _make_session({
+    "Accept-Encoding": "gzip",
+    "User-Agent": USER_AGENT,
+}, pool_size=EXPORT_WORKERS)
+_clickup_session = _make_session({
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": USER_AGENT,
+}, pool_size=MAX_WORKERS, retry_cls=_ClickUpRetry)
 
 
 # ---------------------------------------------------------------------------
@@ -53,28 +317,94 @@ RATE_LIMIT_DELAY = 0.6
 
 GCP_QUOTA_PROJECT = "gold-box-488021-d9"
 
+# Refresh Google access tokens this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 60
+
+_google_token: dict = {}
+_google_token_lock = threading.Lock()
 
-def get_google_access_token() -> str:
-    """Get a Google OAuth2 access token from gcloud ADC credentials."""
+
+def get_google_access_token(stale: str | None = None) -> str:
+    """Get a Google OAuth2 access token, refreshing only when needed.
+
+    The token is cached in memory and in ``TOKEN_CACHE_FILE`` so reruns
+    within its lifetime skip the OAuth round-trip, as long as the ADC
+    credentials are still the ones it was issued for. Pass ``stale`` with a
+    token the API rejected to force a refresh, unless another thread has
+    already replaced it.
+    """
+    with _google_token_lock:
+        if not _google_token:
+            _google_token.update(_load_cached_token())
+
+        token = _google_token.get("access_token")
+        expires_at = _google_token.get("expires_at", 0)
+        if token and token != stale and expires_at - time.time() > TOKEN_EXPIRY_MARGIN:
+            return token
+
+        _google_token.update(_refresh_google_token())
+        _save_cached_token(_google_token)
+        return _google_token["access_token"]
+
+
+def _refresh_google_token() -> dict:
+    """Exchange the gcloud ADC refresh token for a new access token."""
     if not ADC_FILE.exists():
-        print(
+        log.error(
             f"ERROR: No credentials found at {ADC_FILE}\n"
             "Run: gcloud auth application-default login --no-browser "
             "--scopes=https://www.googleapis.com/auth/drive.readonly,"
             "https://www.googleapis.com/auth/cloud-platform",
-            file=sys.stderr,
         )
         sys.exit(1)
 
-    adc = json.loads(ADC_FILE.read_text())
-    resp = requests.post(TOKEN_URL, data={
+    adc = _json_loads(ADC_FILE.read_bytes())
+    resp = _drive_session.post(TOKEN_URL, data={
         "client_id": adc["client_id"],
         "client_secret": adc["client_secret"],
         "refresh_token": adc["refresh_token"],
         "grant_type": "refresh_token",
     }, timeout=15)
     resp.raise_for_status()
-    return resp.json()["access_token"]
+    data = _json_loads(resp.content)
+    return {
+        "access_token": data["access_token"],
+        "expires_at": time.time() + data.get("expires_in", 3600),
+        "adc": _adc_fingerprint(adc),
+    }
+
+
+def _adc_fingerprint(adc: dict) -> str:
+    """Identify the ADC credentials a token was issued for."""
+    return hashlib.sha256(f"{adc['client_id']}:{adc['refresh_token']}".encode()).hexdigest()
+
+
+def _load_cached_token() -> dict:
+    """Return the cached token, unless it belongs to other ADC credentials.
+
+    After ``gcloud auth application-default login`` as another account,
+    the old token would not get a 401; Drive would just list nothing.
+    """
+    try:
+        token = _json_loads(TOKEN_CACHE_FILE.read_bytes())
+        adc = _json_loads(ADC_FILE.read_bytes())
+        if token.get("adc") == _adc_fingerprint(adc):
+            return token
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def _save_cached_token(token: dict) -> None:
+    """Write the token cache, readable by the current user only."""
+    try:
+        TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_json_dumps(token))
+    except OSError:
+        pass  # Caching is best-effort; the token is still usable
 
 
 def _drive_headers(access_token: str) -> dict[str, str]:
@@ -85,12 +415,47 @@ def _drive_headers(access_token: str) -> dict[str, str]:
     }
 
 
+def _drive_request(
+    method: str,
+    url: str,
+    headers: dict[str, str] | None = None,
+    **kwargs,
+) -> requests.Response:
+    """Call a Drive API URL, refreshing the access token once on a 401."""
+    access_token = get_google_access_token()
+    resp = _drive_session.request(
+        method, url, headers={**_drive_headers(access_token), **(headers or {})}, **kwargs,
+    )
+    if resp.status_code == 401:
+        # Release the connection first; with stream=True it is still held
+        resp.close()
+        access_token = get_google_access_token(stale=access_token)
+        resp = _drive_session.request(
+            method, url, headers={**_drive_headers(access_token), **(headers or {})}, **kwargs,
+        )
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError:
+        resp.close()
+        raise
+    return resp
+
+
+def _drive_get(url: str, **kwargs) -> requests.Response:
+    return _drive_request("GET", url, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
 def get_clickup_token() -> str:
     """Retrieve ClickUp API token from env var or 1Password."""
     token = os.environ.get("CLICKUP_API_TOKEN")
     if token:
         return token
 
+    token = _load_cached_clickup_token()
+    if token:
+        return token
+
     # Try 1Password CLI
     try:
         result = subprocess.run(
@@ -104,98 +469,252 @@ def get_clickup_token() -> str:
             timeout=15,
         )
         if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
+            token = result.stdout.strip()
+            _save_cached_clickup_token(token)
+            return token
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
 
-    print(
+    log.error(
         "ERROR: No ClickUp API token found.\n"
         "Set CLICKUP_API_TOKEN env var.",
-        file=sys.stderr,
     )
     sys.exit(1)
 
 
+def _load_cached_clickup_token() -> str | None:
+    """Return the cached ClickUp token if it is younger than the TTL."""
+    try:
+        if time.time() - CLICKUP_TOKEN_CACHE.stat().st_mtime < CLICKUP_TOKEN_TTL:
+            return CLICKUP_TOKEN_CACHE.read_text().strip() or None
+        # Expired: don't leave the plaintext token on disk
+        CLICKUP_TOKEN_CACHE.unlink()
+    except OSError:
+        pass
+    return None
+
+
+def _save_cached_clickup_token(token: str) -> None:
+    """Write the token cache, readable by the current user only."""
+    try:
+        CLICKUP_TOKEN_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(CLICKUP_TOKEN_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(token)
+    except OSError:
+        pass  # Caching is best-effort; the token is still usable
+
+
+def _drop_rejected_clickup_token(resp: requests.Response, *args, **kwargs) -> None:
+    """Response hook: forget the cached ClickUp token once ClickUp rejects it.
+
+    The next lookup reads 1Password again, so a rotated token takes effect
+    on the next run rather than after the cache TTL.
+    """
+    if resp.status_code == 401:
+        get_clickup_token.cache_clear()
+        try:
+            CLICKUP_TOKEN_CACHE.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+_clickup_session.hooks["response"].append(_drop_rejected_clickup_token)
+
+
 # ---------------------------------------------------------------------------
 # State management (idempotency)
 # ---------------------------------------------------------------------------
 
 def load_state() -> set[str]:
-    """Load set of already-processed Google Doc IDs."""
+    """Load set of already-processed Google Doc IDs.
+
+    Combines the compacted ``STATE_FILE`` with any IDs appended to
+    ``STATE_LOG`` by a run that did not finish.
+    """
+    processed: set[str] = set()
     if STATE_FILE.exists():
-        data = json.loads(STATE_FILE.read_text())
-        return set(data.get("processed_ids", []))
-    return set()
+        data = _json_loads(STATE_FILE.read_bytes())
+        processed.update(data.get("processed_ids", []))
+    if STATE_LOG.exists():
+        processed.update(line for line in STATE_LOG.read_text().splitlines() if line)
+    return processed
+
+
+def open_state_log():
+    """Open ``STATE_LOG`` for appending, terminating any torn last line.
+
+    A run killed mid-write can leave a partial ID with no newline. Appending
+    straight after it would fuse it with the next ID and lose that record.
+    """
+    STATE_LOG.parent.mkdir(parents=True, exist_ok=True)
+    state_log = open(STATE_LOG, "a")
+    if state_log.tell() and not STATE_LOG.read_bytes().endswith(b"\n"):
+        state_log.write("\n")
+    return state_log
+
+
+def record_processed(state_log, doc_id: str) -> None:
+    """Append one processed doc ID to the state log and sync it to disk.
+
+    O(1) per doc, unlike rewriting the whole state file, and a crash can at
+    worst lose the line being written.
+    """
+    state_log.write(doc_id + "\n")
+    state_log.flush()
+    os.fsync(state_log.fileno())
 
 
 def save_state(processed_ids: set[str]) -> None:
-    """Persist processed doc IDs to state file."""
+    """Compact processed doc IDs into the state file and clear the log.
+
+    The state file is replaced atomically, and the log is only removed once
+    the new file is on disk, so an interrupted compaction loses nothing.
+    """
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(
+    _write_atomic(STATE_FILE, _json_dumps(
         {"processed_ids": sorted(processed_ids)},
-        indent=2,
+        indent=True,
     ))
+    STATE_LOG.unlink(missing_ok=True)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via a synced sibling temp file and ``os.replace``."""
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False,
+    ) as tmp:
+        try:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, path)
 
 
 # ---------------------------------------------------------------------------
 # Google Drive operations (raw HTTP, no googleapiclient)
 # ---------------------------------------------------------------------------
 
-def list_standup_docs(access_token: str, folder_id: str, name_filter: str) -> list[dict]:
+def _quote_drive_literal(value: str) -> str:
+    """Escape a value for use inside a single-quoted Drive query string."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+def list_standup_docs(folder_id: str, name_filter: str) -> list[dict]:
     """List all Google Docs in folder matching the name filter."""
     query = (
-        f"'{folder_id}' in parents"
+        f"'{_quote_drive_literal(folder_id)}' in parents"
         f" and mimeType='application/vnd.google-apps.document'"
-        f" and name contains '{name_filter}'"
+        f" and name contains '{_quote_drive_literal(name_filter)}'"
         f" and trashed=false"
     )
-    headers = _drive_headers(access_token)
+    params = {
+        "q": query,
+        "fields": "nextPageToken, files(id, name, createdTime)",
+        "pageSize": 1000,  # Drive's maximum, to minimise round-trips
+        # Without these, a folder on a shared drive lists as empty
+        "supportsAllDrives": "true",
+        "includeItemsFromAllDrives": "true",
+    }
     docs = []
-    page_token = None
 
     while True:
-        params = {
-            "q": query,
-            "fields": "nextPageToken, files(id, name, createdTime, modifiedTime)",
-            "pageSize": 100,
-            "orderBy": "createdTime",
-        }
-        if page_token:
-            params["pageToken"] = page_token
-
-        resp = requests.get(
-            f"{DRIVE_API}/files",
-            headers=headers,
-            params=params,
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+        resp = _drive_get(f"{DRIVE_API}/files", params=params, timeout=30)
+        data = _json_loads(resp.content)
 
         docs.extend(data.get("files", []))
         page_token = data.get("nextPageToken")
         if not page_token:
             break
+        params["pageToken"] = page_token
 
+    # Sorted here rather than with orderBy, which costs a server-side sort.
+    # RFC 3339 UTC timestamps sort correctly as strings.
+    docs.sort(key=lambda d: d["createdTime"])
     return docs
 
 
-def export_doc_as_text(access_token: str, doc_id: str) -> str:
+def export_doc_as_text(doc_id: str) -> str:
     """Export a Google Doc as plain text."""
-    resp = requests.get(
+    resp = _drive_get(
         f"{DRIVE_API}/files/{doc_id}/export",
-        headers=_drive_headers(access_token),
         params={"mimeType": "text/plain"},
         timeout=30,
+        stream=True,
     )
-    resp.raise_for_status()
-    return resp.text
+    # Decode chunks as they arrive, so the whole body is never held as bytes
+    # next to its decoded copy. Drive exports plain text as UTF-8; decoding
+    # directly also skips requests' charset detection over the whole body.
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with resp:
+        parts = [decoder.decode(chunk) for chunk in resp.iter_content(EXPORT_CHUNK_SIZE)]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+# Set once the batch endpoint has rejected exports, so the remaining chunks
+# go straight to per-doc exports instead of paying for a failed batch each
+_batch_export_unsupported = threading.Event()
+
+
+def export_docs_batch(doc_ids: list[str]) -> dict[str, str]:
+    """Export up to ``DRIVE_BATCH_SIZE`` Google Docs in one batch request.
+
+    Sends one ``multipart/mixed`` POST to the Drive batch endpoint, with one
+    export sub-request per doc. Returns ``{doc_id: text}`` for the parts
+    that succeeded. Drive documents that media downloads may not work in a
+    batch, so callers must export any missing IDs one by one.
+    """
+    boundary = "batch_standup_backfill"
+    parts = [
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <{doc_id}>\r\n"
+        "\r\n"
+        f"GET /drive/v3/files/{doc_id}/export?mimeType=text%2Fplain\r\n"
+        "\r\n"
+        for doc_id in doc_ids
+    ]
+    body = "".join(parts) + f"--{boundary}--\r\n"
+
+    resp = _drive_request(
+        "POST",
+        DRIVE_BATCH_URL,
+        headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        data=body.encode(),
+        timeout=60,
+    )
+
+    # Let the email parser split the multipart body on its boundary
+    message = email.message_from_bytes(
+        f"Content-Type: {resp.headers['Content-Type']}\r\n\r\n".encode()
+        + resp.content
+    )
+    texts: dict[str, str] = {}
+    for part in message.get_payload():
+        content_id = (part.get("Content-ID") or "").strip("<>")
+        doc_id = content_id.removeprefix("response-")
+        # Each part is a raw HTTP response: status line, headers, body
+        raw = part.get_payload(decode=True)
+        head, _, payload = raw.partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0].split()
+        if doc_id in doc_ids and len(status_line) > 1 and status_line[1] == b"200":
+            texts[doc_id] = payload.decode("utf-8")
+    return texts
 
 
 # ---------------------------------------------------------------------------
 # ClickUp operations
 # ---------------------------------------------------------------------------
 
+def _clickup_headers(token: str) -> dict[str, str]:
+    return {"Authorization": token}
+
+
 def create_clickup_doc(
     token: str,
     workspace_id: str,
@@ -211,6 +730,7 @@ def create_clickup_doc(
     added separately via ``get_doc_pages()`` + ``edit_default_page()``.  We
     still send ``content`` in case ClickUp changes this behaviour in the future.
     """
+    _clickup_limiter.acquire()
     url = CLICKUP_DOCS_URL.format(workspace=workspace_id)
     payload = {
         "name": name,
@@ -221,17 +741,44 @@ def create_clickup_doc(
             "type": parent_type,
         },
     }
-    resp = requests.post(
+    resp = _clickup_session.post(
         url,
-        headers={
-            "Authorization": token,
-            "Content-Type": "application/json",
-        },
-        json=payload,
+        headers=_clickup_headers(token),
+        data=_json_dumps(payload),
         timeout=30,
     )
     resp.raise_for_status()
-    return resp.json()
+    return _json_loads(resp.content)
+
+
+def list_clickup_docs(token: str, workspace_id: str, parent_id: str, parent_type: int) -> list[dict]:
+    """List the ClickUp Docs under a parent, following ``next_cursor`` pages.
+
+    Filters by parent client-side as well, since the API may ignore the
+    parent filter (match fix-existing-standup-docs.py).
+    """
+    url = CLICKUP_DOCS_URL.format(workspace=workspace_id)
+    params = {"parent.id": parent_id, "parent.type": str(parent_type)}
+    docs = []
+
+    while True:
+        _clickup_limiter.acquire()
+        resp = _clickup_session.get(
+            url,
+            headers=_clickup_headers(token),
+            params=params,
+            timeout=30,
+        )
+        resp.raise_for_status()
+        data = _json_loads(resp.content)
+
+        docs.extend(data.get("docs", []))
+        cursor = data.get("next_cursor")
+        if not cursor:
+            break
+        params["next_cursor"] = cursor
+
+    return [d for d in docs if d.get("parent", {}).get("id") == parent_id]
 
 
 def extract_doc_id(result: dict) -> str | None:
@@ -244,6 +791,19 @@ def extract_doc_id(result: dict) -> str | None:
     return result.get("id")
 
 
+def extract_default_page_id(result: dict) -> str | None:
+    """Extract the auto-created default page ID from a create-doc response.
+
+    Returns None when the response does not include the doc's pages, in
+    which case the caller has to fall back to ``get_doc_pages()``.
+    """
+    doc = result.get("data") if isinstance(result.get("data"), dict) else result
+    pages = doc.get("pages")
+    if isinstance(pages, list) and pages and isinstance(pages[0], dict):
+        return pages[0].get("id")
+    return None
+
+
 def get_doc_pages(
     token: str,
     workspace_id: str,
@@ -253,20 +813,18 @@ def get_doc_pages(
 
     Returns the list of pages. The first element is the auto-created default page.
     """
+    _clickup_limiter.acquire()
     url = (
         f"https://api.clickup.com/api/v3/workspaces/{workspace_id}"
         f"/docs/{doc_id}/page_listing"
     )
-    resp = requests.get(
+    resp = _clickup_session.get(
         url,
-        headers={
-            "Authorization": token,
-            "Content-Type": "application/json",
-        },
+        headers=_clickup_headers(token),
         timeout=30,
     )
     resp.raise_for_status()
-    data = resp.json()
+    data = _json_loads(resp.content)
     if isinstance(data, list):
         return data
     return data.get("pages", [])
@@ -285,6 +843,7 @@ def edit_default_page(
     ClickUp auto-creates a blank default page when a doc is created.
     This edits that page in-place instead of creating a second page.
     """
+    _clickup_limiter.acquire()
     url = (
         f"https://api.clickup.com/api/v3/workspaces/{workspace_id}"
         f"/docs/{doc_id}/pages/{page_id}"
@@ -295,13 +854,10 @@ def edit_default_page(
         "content_format": "text/md",
         "content_edit_mode": "replace",
     }
-    resp = requests.put(
+    resp = _clickup_session.put(
         url,
-        headers={
-            "Authorization": token,
-            "Content-Type": "application/json",
-        },
-        json=payload,
+        headers=_clickup_headers(token),
+        data=_json_dumps(payload),
         timeout=30,
     )
     resp.raise_for_status()
@@ -311,31 +867,205 @@ def edit_default_page(
 # Formatting (matches n8n workflow "Format for ClickUp" node)
 # ---------------------------------------------------------------------------
 
+def parse_created_time(created_time: str) -> datetime:
+    """Parse a Drive RFC 3339 timestamp such as ``2026-02-25T15:02:11.000Z``."""
+    # fromisoformat() only accepts a "Z" suffix from Python 3.11
+    if sys.version_info < (3, 11) and created_time.endswith("Z"):
+        created_time = created_time[:-1] + "+00:00"
+    return datetime.fromisoformat(created_time)
+
+
+def clickup_doc_name(created_time: str) -> str:
+    """ClickUp Doc name for a Drive doc, from the date its timestamp starts with."""
+    return f"Daily Standup \u2014 {created_time[:10]}"
+
+
 def format_doc(file_name: str, created_time: str, text_content: str) -> tuple[str, str, str]:
     """Format a doc matching the n8n workflow output.
 
     Returns (doc_name, description, content).
     """
-    dt = datetime.fromisoformat(created_time.replace("Z", "+00:00"))
-    iso_date = dt.strftime("%Y-%m-%d")
-    display_date = dt.strftime("%A, %B %-d, %Y")
+    dt = parse_created_time(created_time)
+    iso_date = created_time[:10]
+    doc_name = clickup_doc_name(created_time)
+    # dt.day rather than "%-d", which is glibc-only and fails on Windows
+    display_date = f"{dt:%A, %B} {dt.day}, {dt.year}"
 
-    doc_name = f"Daily Standup \u2014 {iso_date}"
     description = f"Standup notes from Google Meet ({iso_date})"
-    content = "\n".join([
-        f"# {doc_name}",
-        "",
-        f"**Source:** {file_name}",
-        f"**Date:** {display_date}",
-        "",
-        "---",
-        "",
-        text_content,
-    ])
+    content = (
+        f"# {doc_name}\n"
+        "\n"
+        f"**Source:** {file_name}\n"
+        f"**Date:** {display_date}\n"
+        "\n"
+        "---\n"
+        "\n"
+        f"{text_content}"
+    )
 
     return doc_name, description, content
 
 
+# ---------------------------------------------------------------------------
+# Per-doc pipeline
+# ---------------------------------------------------------------------------
+
+def export_worker(
+    todo: queue.Queue,
+    exported: queue.Queue,
+    results: queue.Queue,
+) -> None:
+    """Drive stage: export queued chunks of docs.
+
+    Multi-doc chunks are exported with one batch request; any doc the batch
+    did not return is queued again on its own so the fallback exports are
+    spread across workers. Once the batch endpoint rejects exports, later
+    chunks skip it. Formatted docs go to ``exported`` (blocking while
+    the writers catch up, with the rest of the batch still held); failures
+    go straight to ``results``.
+    """
+    while True:
+        chunk = todo.get()
+
+        if len(chunk) > 1:
+            texts: dict[str, str] = {}
+            if not _batch_export_unsupported.is_set():
+                try:
+                    texts = export_docs_batch([doc["id"] for doc in chunk])
+                except Exception as e:
+                    log.warning(f"  Batch export failed, exporting individually: {e}")
+                    status = getattr(getattr(e, "response", None), "status_code", None)
+                    if status is not None and 400 <= status < 500:
+                        _batch_export_unsupported.set()
+                else:
+                    if not texts:
+                        # Answered, but no export succeeded: media is not
+                        # served through batch here, so stop trying it
+                        log.warning("  Batch export returned no docs, exporting individually")
+                        _batch_export_unsupported.set()
+            for doc in chunk:
+                if doc["id"] in texts:
+                    _put_formatted(doc, texts.pop(doc["id"]), exported, results)
+                else:
+                    todo.put([doc])
+            continue
+
+        doc = chunk[0]
+        try:
+            text = export_doc_as_text(doc["id"])
+        except Exception as e:
+            log.error(f"  [{doc['name']}] ERROR (Drive export): {e}")
+            results.put((doc, False))
+            continue
+
+        _put_formatted(doc, text, exported, results)
+
+
+def _put_formatted(
+    doc: dict,
+    text: str,
+    exported: queue.Queue,
+    results: queue.Queue,
+) -> None:
+    """Format an exported doc and hand it to the ClickUp stage.
+
+    Formatting here means only the final content waits in the queue, not
+    the raw export alongside it.
+    """
+    try:
+        formatted = format_doc(doc["name"], doc["createdTime"], text)
+    except Exception as e:
+        log.error(f"  [{doc['name']}] ERROR: {e}")
+        results.put((doc, False))
+        return
+    exported.put((doc, formatted))
+
+
+def write_worker(
+    clickup_token: str,
+    args: argparse.Namespace,
+    exported: queue.Queue,
+    results: queue.Queue,
+) -> None:
+    """ClickUp stage: write formatted docs as they arrive."""
+    while True:
+        doc, formatted = exported.get()
+        results.put((doc, write_doc(doc, *formatted, clickup_token, args)))
+
+
+def write_doc(
+    doc: dict,
+    doc_name: str,
+    description: str,
+    content: str,
+    clickup_token: str,
+    args: argparse.Namespace,
+) -> bool:
+    """Create a ClickUp Doc for an exported Google Doc.
+
+    Errors are reported and swallowed so one bad doc does not abort the
+    batch. Returns True on success.
+    """
+    label = doc["name"]
+
+    try:
+        # Stage 1: Create empty doc shell in ClickUp
+        result = create_clickup_doc(
+            clickup_token,
+            args.workspace_id,
+            args.clickup_parent_id,
+            args.clickup_parent_type,
+            doc_name,
+            description,
+            content,
+        )
+
+        doc_id = extract_doc_id(result)
+        if not doc_id:
+            snippet = _json_dumps(result)[:300].decode(errors="replace")
+            log.error(f"  [{label}] ERROR: No doc ID in response: {snippet}")
+            return False
+
+        log.info(f"  [{label}] Created ClickUp Doc: {doc_name} (id: {doc_id})")
+
+        # Stage 2: Get the auto-created default page (only listed if the
+        # create response did not already include it)
+        default_page_id = extract_default_page_id(result)
+        if not default_page_id:
+            pages = get_doc_pages(
+                clickup_token,
+                args.workspace_id,
+                doc_id,
+            )
+            if not pages:
+                log.error(f"  [{label}] ERROR: No pages found for doc {doc_id}")
+                return False
+
+            default_page_id = pages[0]["id"]
+
+        # Stage 3: Edit the default page with content (PUT, not POST)
+        edit_default_page(
+            clickup_token,
+            args.workspace_id,
+            doc_id,
+            default_page_id,
+            doc_name,
+            content,
+        )
+        log.info(f"  [{label}] Edited default page {default_page_id} in doc {doc_id}")
+        return True
+
+    except requests.HTTPError as e:
+        log.error(f"  [{label}] ERROR (ClickUp API): {e}")
+        if e.response is not None:
+            log.error(f"  [{label}] Response: {e.response.text}")
+        return False
+
+    except Exception as e:
+        log.error(f"  [{label}] ERROR: {e}")
+        return False
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -378,148 +1108,173 @@ def parse_args() -> argparse.Namespace:
     p.add_argument(
         "--reset-state",
         action="store_true",
-        help="Clear the processed-IDs state file before running.",
+        help=(
+            "Clear the processed-IDs state file before running. Docs already "
+            "in ClickUp are still skipped unless --recreate-existing is given."
+        ),
+    )
+    p.add_argument(
+        "--recreate-existing",
+        action="store_true",
+        help=(
+            "Create docs even when ClickUp already has one with the same name "
+            "(this creates duplicates of those docs)."
+        ),
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=(
+            "Docs written to ClickUp concurrently; 1 writes them one at a "
+            f"time. The rate limit is shared by all workers (default: {MAX_WORKERS})"
+        ),
+    )
+    p.add_argument(
+        "--export-workers",
+        type=int,
+        default=EXPORT_WORKERS,
+        help=(
+            "Drive exports run concurrently ahead of the ClickUp writers "
+            f"(default: {EXPORT_WORKERS})"
+        ),
     )
-    return p.parse_args()
+    args = p.parse_args()
+    if args.workers < 1:
+        p.error("--workers must be at least 1")
+    if args.export_workers < 1:
+        p.error("--export-workers must be at least 1")
+    return args
 
 
 def main() -> None:
     args = parse_args()
+    configure_logging()
 
-    if args.reset_state and STATE_FILE.exists():
-        STATE_FILE.unlink()
-        print(f"Cleared state file: {STATE_FILE}")
+    if args.reset_state and (STATE_FILE.exists() or STATE_LOG.exists()):
+        STATE_FILE.unlink(missing_ok=True)
+        STATE_LOG.unlink(missing_ok=True)
+        log.info(f"Cleared state file: {STATE_FILE}")
 
     # --- Auth ---
-    print("Authenticating to Google Drive...")
-    access_token = get_google_access_token()
+    log.info("Authenticating to Google Drive...")
+    get_google_access_token()
 
     if not args.dry_run:
-        print("Retrieving ClickUp API token...")
+        log.info("Retrieving ClickUp API token...")
         clickup_token = get_clickup_token()
 
     # --- List docs ---
-    print(f"Listing docs in folder {args.folder_id} matching '{args.filter}'...")
-    docs = list_standup_docs(access_token, args.folder_id, args.filter)
-    print(f"Found {len(docs)} matching doc(s) in Google Drive.")
+    log.info(f"Listing docs in folder {args.folder_id} matching '{args.filter}'...")
+    docs = list_standup_docs(args.folder_id, args.filter)
+    log.info(f"Found {len(docs)} matching doc(s) in Google Drive.")
 
     if not docs:
-        print("Nothing to do.")
+        log.info("Nothing to do.")
         return
 
     # --- Load state ---
     processed = load_state()
-    to_process = [d for d in docs if d["id"] not in processed]
-    skipped = len(docs) - len(to_process)
+    # Keyed by ID so a doc listed twice (e.g. on two listing pages when the
+    # folder changes mid-listing) is queued, exported and created only once
+    unique_docs = list({d["id"]: d for d in docs}.values())
+    if len(unique_docs) < len(docs):
+        log.info(f"Ignoring {len(docs) - len(unique_docs)} duplicate Drive listing(s).")
+    to_process = [d for d in unique_docs if d["id"] not in processed]
+    skipped = len(unique_docs) - len(to_process)
 
     if skipped:
-        print(f"Skipping {skipped} already-processed doc(s).")
+        log.info(f"Skipping {skipped} already-processed doc(s).")
 
     if not to_process:
-        print("All docs already processed. Use --reset-state to re-process.")
+        log.info(
+            "All docs already processed. Use --reset-state to re-process "
+            "(with --recreate-existing for docs already in ClickUp).",
+        )
         return
 
-    print(f"{len(to_process)} doc(s) to process.")
+    # The state file only knows what this machine created. Skip docs that
+    # already exist in ClickUp, so a lost state file cannot cause duplicates.
+    if not args.dry_run and not args.recreate_existing:
+        existing_names = {
+            d.get("name") for d in list_clickup_docs(
+                clickup_token, args.workspace_id,
+                args.clickup_parent_id, args.clickup_parent_type,
+            )
+        }
+        existing = [d for d in to_process if clickup_doc_name(d["createdTime"]) in existing_names]
+        if existing:
+            log.info(f"Skipping {len(existing)} doc(s) already in ClickUp.")
+            skipped += len(existing)
+            processed.update(d["id"] for d in existing)
+            save_state(processed)
+            to_process = [d for d in to_process if d["id"] not in processed]
+
+        if not to_process:
+            log.info("All docs already exist in ClickUp. Use --recreate-existing to create them again.")
+            return
+
+    log.info(f"{len(to_process)} doc(s) to process.")
 
     if args.dry_run:
-        print("\n--- DRY RUN ---")
+        log.info("--- DRY RUN ---")
         for doc in to_process:
-            dt = datetime.fromisoformat(doc["createdTime"].replace("Z", "+00:00"))
-            print(f"  [{dt.strftime('%Y-%m-%d')}] {doc['name']}  (id: {doc['id']})")
-        print(f"\nTotal: {len(to_process)} doc(s) would be created in ClickUp.")
+            # RFC 3339 timestamps start with the date; no parsing needed
+            log.info(f"  [{doc['createdTime'][:10]}] {doc['name']}  (id: {doc['id']})")
+        log.info(f"Total: {len(to_process)} doc(s) would be created in ClickUp.")
         return
 
     # --- Process ---
     created = 0
     errors = 0
 
-    for i, doc in enumerate(to_process, 1):
-        print(f"\n[{i}/{len(to_process)}] {doc['name']}")
-
-        try:
-            # Export from Google Drive
-            text = export_doc_as_text(access_token, doc["id"])
-            doc_name, description, content = format_doc(
-                doc["name"], doc["createdTime"], text
-            )
-
-            # Stage 1: Create empty doc shell in ClickUp
-            result = create_clickup_doc(
-                clickup_token,
-                args.workspace_id,
-                args.clickup_parent_id,
-                args.clickup_parent_type,
-                doc_name,
-                description,
-                content,
-            )
-
-            doc_id = extract_doc_id(result)
-            if not doc_id:
-                print(
-                    f"  ERROR: No doc ID in response: {json.dumps(result)[:300]}",
-                    file=sys.stderr,
-                )
-                errors += 1
-                continue
-
-            print(f"  Created ClickUp Doc: {doc_name} (id: {doc_id})")
+    todo: queue.Queue = queue.Queue()
+    for start in range(0, len(to_process), DRIVE_BATCH_SIZE):
+        todo.put(to_process[start:start + DRIVE_BATCH_SIZE])
+    exported: queue.Queue = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+    results: queue.Queue = queue.Queue()
+
+    # Daemon threads: an interrupted run exits without waiting on them
+    _drive_session.mount("https://", _make_adapter(args.export_workers))
+    for _ in range(args.export_workers):
+        threading.Thread(
+            target=export_worker,
+            args=(todo, exported, results),
+            daemon=True,
+        ).start()
+    _clickup_session.mount("https://", _make_adapter(args.workers, _ClickUpRetry))
+    for _ in range(args.workers):
+        threading.Thread(
+            target=write_worker,
+            args=(clickup_token, args, exported, results),
+            daemon=True,
+        ).start()
 
-            # Stage 2: Get the auto-created default page
-            time.sleep(RATE_LIMIT_DELAY)
-            pages = get_doc_pages(
-                clickup_token,
-                args.workspace_id,
-                doc_id,
-            )
-            if not pages:
-                print(
-                    f"  ERROR: No pages found for doc {doc_id}",
-                    file=sys.stderr,
-                )
-                errors += 1
-                continue
-
-            default_page_id = pages[0]["id"]
-
-            # Stage 3: Edit the default page with content (PUT, not POST)
-            time.sleep(RATE_LIMIT_DELAY)
-            edit_default_page(
-                clickup_token,
-                args.workspace_id,
-                doc_id,
-                default_page_id,
-                doc_name,
-                content,
-            )
-            print(f"  Edited default page {default_page_id} in doc {doc_id}")
-
-            # Record success
-            processed.add(doc["id"])
+    try:
+        with open_state_log() as state_log:
+            for i in range(1, len(to_process) + 1):
+                doc, ok = results.get()
+                if ok:
+                    # Record success (main thread only, so no locking needed)
+                    processed.add(doc["id"])
+                    record_processed(state_log, doc["id"])
+                    created += 1
+                    log.info(f"[{i}/{len(to_process)}] Done: {doc['name']}")
+                else:
+                    errors += 1
+                    log.info(f"[{i}/{len(to_process)}] Failed: {doc['name']}")
+    finally:
+        # The only sort of the full ID set: once per run, even if interrupted
+        if created:
             save_state(processed)
-            created += 1
-
-        except requests.HTTPError as e:
-            print(f"  ERROR (ClickUp API): {e}", file=sys.stderr)
-            if e.response is not None:
-                print(f"  Response: {e.response.text}", file=sys.stderr)
-            errors += 1
-
-        except Exception as e:
-            print(f"  ERROR: {e}", file=sys.stderr)
-            errors += 1
-
-        # Rate limit (skip delay after last item)
-        if i < len(to_process):
-            time.sleep(RATE_LIMIT_DELAY)
 
     # --- Summary ---
-    print(f"\n{'=' * 40}")
-    print(f"Backfill complete.")
-    print(f"  Created:  {created}")
-    print(f"  Skipped:  {skipped}")
-    print(f"  Errors:   {errors}")
-    print(f"  State:    {STATE_FILE}")
+    log.info(f"{'=' * 40}")
+    log.info(f"Backfill complete.")
+    log.info(f"  Created:  {created}")
+    log.info(f"  Skipped:  {skipped}")
+    log.info(f"  Errors:   {errors}")
+    log.info(f"  State:    {STATE_FILE}")
 
 
 if __name__ == "__main__":
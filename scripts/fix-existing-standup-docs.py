@@ -21,35 +21,112 @@ Usage:
     python scripts/fix-existing-standup-docs.py --dry-run
     python scripts/fix-existing-standup-docs.py --refill-from-drive
     python scripts/fix-existing-standup-docs.py --refill-from-drive --dry-run
+
+Optional: pip install orjson (faster JSON; stdlib json is used without it)
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
+import codecs
+import dbm
+import email
+import enum
+import functools
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import random
 import re
+import shelve
 import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used without it
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no file locks, so the ETag cache stays in memory
+    fcntl = None
 
 WORKSPACE_ID = "9017833757"
 FOLDER_ID = "90176857901"
 CLICKUP_BASE = f"https://api.clickup.com/api/v3/workspaces/{WORKSPACE_ID}"
-RATE_LIMIT_DELAY = 0.6
+
+# Folder listing reused across reruns; --refresh-listing forces a re-fetch
+LISTING_CACHE = Path.home() / ".cache" / f"clickup-docs-{FOLDER_ID}.json"
+LISTING_CACHE_TTL = 3600
+
+# Docs found with content on page 1, skipped by later runs until the doc
+# changes or the entry expires; --recheck inspects them anyway
+VERIFIED_CACHE = Path.home() / ".cache" / f"clickup-docs-verified-{FOLDER_ID}.json"
+VERIFIED_TTL = 24 * 3600
+
+# ClickUp GET bodies kept with their ETags, revalidated with If-None-Match.
+# Entries older than the TTL are dropped when the cache is opened. Only one
+# run at a time may use it; GET_CACHE_LOCK is held while it is open.
+GET_CACHE = Path.home() / ".cache" / "clickup-get-cache"
+GET_CACHE_LOCK = Path.home() / ".cache" / "clickup-get-cache.lock"
+GET_CACHE_TTL = 7 * 24 * 3600
+
+# ClickUp rate limit: 100 req/min. Budget 95/min with a small burst so that
+# no 60s window can exceed 100 requests (match backfill-standup-notes.py).
+CLICKUP_CALLS_PER_MINUTE = 95
+CLICKUP_BURST = 5
+
+# Docs are inspected, then fixed, by this many threads per pass. They all
+# share the rate limit; concurrency only overlaps request latency.
+MAX_WORKERS = 8
+
+# Retries for 429/5xx: exponential backoff from 2s, capped at 32s, with up
+# to 50% jitter on top (2, 4, 8, 16, 32s). The five retries take at least
+# 62s, so a throttled call outlasts ClickUp's 60s rate-limit window even
+# without an X-RateLimit-Reset header; with one, a 429 waits for the reset
+# (at most RATE_LIMIT_RESET_MAX seconds).
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 2
+RETRY_BACKOFF_MAX = 32
+RATE_LIMIT_RESET_MAX = 65
 
 # Google Drive settings (match backfill-standup-notes.py)
 DRIVE_FOLDER_ID = "1OFRQrDFm1buSwdh2IX_YbkWAaWfge4bk"
 DRIVE_NAME_FILTER = "Daily Standup and Checkin"
 DRIVE_API = "https://www.googleapis.com/drive/v3"
+DRIVE_BATCH_URL = "https://www.googleapis.com/batch/drive/v3"
+DRIVE_BATCH_SIZE = 100  # Drive's maximum sub-requests per batch
+EXPORT_CHUNK_SIZE = 256 * 1024  # Bytes read per chunk when streaming an export
 GCP_QUOTA_PROJECT = "gold-box-488021-d9"
 ADC_FILE = Path.home() / ".config" / "gcloud" / "application_default_credentials.json"
 TOKEN_URL = "https://oauth2.googleapis.com/token"
 
+# Refresh Google access tokens this many seconds before they expire
+TOKEN_EXPIRY_MARGIN = 60
+
+# Google only gzips responses when the User-Agent also contains "gzip"
+USER_AGENT = "standup-fix/1.0 (gzip)"
+
+# ClickUp token read from 1Password, cached briefly so back-to-back runs of
+# these scripts spawn `op` once (shared with backfill-standup-notes.py)
+CLICKUP_TOKEN_CACHE = Path.home() / ".cache" / "clickup-token"
+CLICKUP_TOKEN_TTL = 600
+
 KNOWN_DUPLICATES = {
     "2026-02-18": {"original": "8cr2e8x-1717", "duplicate": "8cr2e8x-1857"},
     "2026-02-17": {"original": "8cr2e8x-1737", "duplicate": "8cr2e8x-1877"},
@@ -59,6 +136,186 @@ KNOWN_DUPLICATES = {
     "2026-02-11": {"original": "8cr2e8x-1817", "duplicate": "8cr2e8x-1957"},
     "2026-02-10": {"original": "8cr2e8x-1837", "duplicate": "8cr2e8x-1977"},
 }
+KNOWN_DUPLICATE_IDS = frozenset(v["duplicate"] for v in KNOWN_DUPLICATES.values())
+
+log = logging.getLogger("standup-fix")
+
+
+def configure_logging() -> None:
+    """Send INFO to stdout and WARNING and above to stderr.
+
+    Records are queued and written by a background listener thread
+    (match backfill-standup-notes.py).
+    """
+    if log.handlers:
+        return
+
+    formatter = logging.Formatter("%(asctime)s %(message)s", datefmt="%H:%M:%S")
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(formatter)
+    stdout_handler.addFilter(lambda record: record.levelno < logging.WARNING)
+    stderr_handler = logging.StreamHandler(sys.stderr)
+    stderr_handler.setFormatter(formatter)
+    stderr_handler.setLevel(logging.WARNING)
+
+    records: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(
+        records, stdout_handler, stderr_handler, respect_handler_level=True,
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    log.addHandler(logging.handlers.QueueHandler(records))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+
+
+def _json_loads(data: bytes | str):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by all ClickUp calls.
+
+    Tokens refill continuously at ``calls`` per ``period`` seconds, up to
+    ``burst``. A call only sleeps when the bucket is empty, so time already
+    spent waiting on responses counts towards the budget.
+    """
+
+    def __init__(self, calls: int, period: float, burst: int) -> None:
+        self._rate = calls / period
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity,
+                self._tokens + (now - self._updated) * self._rate,
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+_clickup_limiter = RateLimiter(CLICKUP_CALLS_PER_MINUTE, 60, CLICKUP_BURST)
+
+
+class _JitteredRetry(Retry):
+    """Retry 429 and 5xx with exponential backoff and upward jitter.
+
+    Unlike urllib3's default schedule, the first retry waits too. A
+    ``Retry-After`` header still takes precedence; failing that, a 429
+    waits for ClickUp's ``X-RateLimit-Reset``. A 429 is retried for any
+    method, since a throttled request was never processed (so even the
+    create-doc POST is safe to resend).
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 429:
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_backoff_time(self) -> float:
+        # history already holds the failure being retried
+        base = self.backoff_factor * 2 ** max(len(self.history) - 1, 0)
+        return min(RETRY_BACKOFF_MAX, base) * random.uniform(1, 1.5)
+
+    def sleep(self, response=None) -> None:
+        if (
+            response is not None
+            and response.status == 429
+            and "Retry-After" not in response.headers
+        ):
+            wait = _rate_limit_reset_wait(response.headers.get("X-RateLimit-Reset"))
+            if wait is not None:
+                time.sleep(wait)
+                return
+        super().sleep(response)
+
+
+class _ClickUpRetry(_JitteredRetry):
+    """Also take a rate-limiter token before each retry, so retries are
+    paced with every other ClickUp call instead of bypassing the budget.
+    """
+
+    def sleep(self, response=None) -> None:
+        super().sleep(response)
+        _clickup_limiter.acquire()
+
+
+def _rate_limit_reset_wait(reset: str | None) -> float | None:
+    """Seconds until the rate-limit window in ``X-RateLimit-Reset`` resets."""
+    try:
+        reset_at = float(reset)
+    except (TypeError, ValueError):
+        return None
+    if reset_at > 1e11:  # Milliseconds rather than seconds
+        reset_at /= 1000
+    wait = reset_at - time.time()
+    if wait <= 0:
+        return None
+    return min(wait, RATE_LIMIT_RESET_MAX) + random.uniform(0, 1)
+
+
+def _make_session(
+    headers: dict[str, str],
+    pool_size: int,
+    retry_cls: type[Retry] = _JitteredRetry,
+) -> requests.Session:
+    """Keep-alive session, so each API's TLS handshake is paid once per
+    pooled connection rather than once per call.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    session.mount("https://", _make_adapter(pool_size, retry_cls))
+    return session
+
+
+def _make_adapter(pool_size: int, retry_cls: type[Retry] = _JitteredRetry) -> HTTPAdapter:
+    """Connection pool sized to the threads sharing it, retrying 429 and 5xx.
+
+    The pool blocks when exhausted, so extra threads wait for a warm
+    connection instead of opening (and then discarding) one of their own.
+    The final response is returned rather than raised, so callers still
+    get ``requests.HTTPError`` from ``raise_for_status()``.
+    """
+    retry = retry_cls(
+        total=RETRY_ATTEMPTS,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+
+_clickup_session = _make_session({
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": USER_AGENT,
+}, pool_size=MAX_WORKERS, retry_cls=_ClickUpRetry)
+_drive_session = _make_session({
+    "Accept-Encoding": "gzip",
+    "User-Agent": USER_AGENT,
+}, pool_size=MAX_WORKERS)
 
 
 def get_clickup_token() -> str:
@@ -67,6 +324,10 @@ def get_clickup_token() -> str:
     if token:
         return token
 
+    token = _load_cached_clickup_token()
+    if token:
+        return token
+
     try:
         result = subprocess.run(
             [
@@ -79,62 +340,294 @@ def get_clickup_token() -> str:
             timeout=15,
         )
         if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
+            token = result.stdout.strip()
+            _save_cached_clickup_token(token)
+            return token
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
 
-    print(
+    log.error(
         "ERROR: No ClickUp API token found.\n"
         "Set CLICKUP_API_TOKEN env var.",
-        file=sys.stderr,
     )
     sys.exit(1)
 
 
+def _load_cached_clickup_token() -> str | None:
+    """Return the cached ClickUp token if it is younger than the TTL."""
+    try:
+        if time.time() - CLICKUP_TOKEN_CACHE.stat().st_mtime < CLICKUP_TOKEN_TTL:
+            return CLICKUP_TOKEN_CACHE.read_text().strip() or None
+        # Expired: don't leave the plaintext token on disk
+        CLICKUP_TOKEN_CACHE.unlink()
+    except OSError:
+        pass
+    return None
+
+
+def _save_cached_clickup_token(token: str) -> None:
+    """Write the token cache, readable by the current user only."""
+    try:
+        CLICKUP_TOKEN_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(CLICKUP_TOKEN_CACHE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(token)
+    except OSError:
+        pass  # Caching is best-effort; the token is still usable
+
+
+def _drop_rejected_clickup_token(resp: requests.Response, *args, **kwargs) -> None:
+    """Response hook: forget the cached ClickUp token once ClickUp rejects it.
+
+    The next lookup reads 1Password again, so a rotated token takes effect
+    on the next run rather than after the cache TTL.
+    """
+    if resp.status_code == 401:
+        try:
+            CLICKUP_TOKEN_CACHE.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+_clickup_session.hooks["response"].append(_drop_rejected_clickup_token)
+
+
 def api_headers(token: str) -> dict[str, str]:
-    return {
-        "Authorization": token,
-        "Content-Type": "application/json",
-    }
+    return {"Authorization": token}
+
+
+_get_cache: shelve.Shelf | dict | None = None
+_get_cache_lock = threading.Lock()
+
+
+def _open_get_cache() -> shelve.Shelf | dict:
+    """Open the ETag cache on first use (call with the lock held).
+
+    Entries are ``(etag, body, stored_at)``; expired ones are evicted here.
+    The cache holds page bodies, so its files are private to the user. If
+    another run holds ``GET_CACHE_LOCK`` (``dbm.dumb`` would otherwise let
+    both write and corrupt it) or the cache cannot be opened, this run
+    caches in memory only.
+    """
+    global _get_cache
+    if _get_cache is None:
+        try:
+            cache = _lock_and_open_get_cache()
+        except BlockingIOError:
+            log.warning("ETag cache in use by another run, not persisting it this run")
+            _get_cache = {}
+            return _get_cache
+        except (OSError, *dbm.error) as e:
+            log.warning(f"ETag cache unavailable, not persisting it this run: {e}")
+            _get_cache = {}
+            return _get_cache
+
+        cutoff = time.time() - GET_CACHE_TTL
+        for key in list(cache.keys()):
+            entry = cache[key]
+            if len(entry) != 3 or entry[2] < cutoff:
+                del cache[key]
+        _get_cache = cache
+    return _get_cache
+
+
+def _lock_and_open_get_cache() -> shelve.Shelf:
+    """Take the cross-run lock, then open the shelf with 0600 files.
+
+    Both are released at exit, the shelf first.
+    """
+    if fcntl is None:
+        raise OSError("file locking is not available on this platform")
+    GET_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    lock_fd = os.open(GET_CACHE_LOCK, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        cache = shelve.Shelf(dbm.open(str(GET_CACHE), "c", 0o600))
+    except BaseException:
+        os.close(lock_fd)  # Also releases the lock
+        raise
+    atexit.register(os.close, lock_fd)
+    atexit.register(cache.close)
+
+    # Files created before the mode was set may still be world-readable
+    for path in GET_CACHE.parent.glob(f"{GET_CACHE.name}*"):
+        try:
+            os.chmod(path, 0o600)
+        except OSError:
+            pass
+    return cache
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Write a cache file readable by the current user only."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+
+
+def cached_get(token: str, url: str, params: dict[str, str] | None = None) -> bytes:
+    """GET a ClickUp URL, revalidating any cached body with its ETag.
+
+    A ``304 Not Modified`` returns the cached body without transferring it
+    again. It still counts against the rate limit, so it is paced like any
+    other call. Responses without an ETag are not cached.
+    """
+    key = requests.Request("GET", url, params=params).prepare().url
+    with _get_cache_lock:
+        etag, body, _ = _open_get_cache().get(key, (None, None, None))
+
+    headers = api_headers(token)
+    if etag:
+        headers["If-None-Match"] = etag
+    _clickup_limiter.acquire()
+    resp = _clickup_session.get(url, headers=headers, params=params, timeout=30)
+    if resp.status_code == 304 and body is not None:
+        return body
+    resp.raise_for_status()
+
+    etag = resp.headers.get("ETag")
+    if etag:
+        with _get_cache_lock:
+            _open_get_cache()[key] = (etag, resp.content, time.time())
+    return resp.content
 
 
 def list_docs(token: str) -> list[dict]:
     """List all docs in the standup folder."""
-    url = f"{CLICKUP_BASE}/docs"
-    resp = requests.get(
-        url,
-        headers=api_headers(token),
+    data = _json_loads(cached_get(
+        token,
+        f"{CLICKUP_BASE}/docs",
         params={"parent.id": FOLDER_ID, "parent.type": "5"},
-        timeout=30,
-    )
-    resp.raise_for_status()
-    data = resp.json()
+    ))
     all_docs = data.get("docs", [])
     # Client-side filter (API may ignore parent filter)
     return [d for d in all_docs if d.get("parent", {}).get("id") == FOLDER_ID]
 
 
+def list_docs_cached(token: str, refresh: bool = False, allow_stale: bool = False) -> list[dict]:
+    """List docs in the standup folder, reusing a recent on-disk listing.
+
+    The listing is cached for ``LISTING_CACHE_TTL`` seconds. ``allow_stale``
+    accepts an older cache (fine for dry runs); ``refresh`` ignores it.
+    """
+    if not refresh:
+        try:
+            age = time.time() - LISTING_CACHE.stat().st_mtime
+            if age < LISTING_CACHE_TTL or allow_stale:
+                docs = _json_loads(LISTING_CACHE.read_bytes())
+                log.info(f"Using cached listing ({int(age // 60)} min old, --refresh-listing to re-fetch)")
+                return docs
+        except (OSError, ValueError):
+            pass
+
+    docs = list_docs(token)
+    try:
+        _write_private(LISTING_CACHE, _json_dumps(docs))
+    except OSError:
+        pass  # Caching is best-effort
+    return docs
+
+
+_verified: dict[str, dict] = {}
+_verified_lock = threading.Lock()
+
+
+def load_verified() -> None:
+    """Load the docs verified OK by earlier runs; saved back at exit."""
+    try:
+        _verified.update(_json_loads(VERIFIED_CACHE.read_bytes()))
+    except (OSError, ValueError):
+        pass
+    atexit.register(save_verified)
+
+
+def save_verified() -> None:
+    now = time.time()
+    with _verified_lock:
+        current = {
+            doc_id: entry for doc_id, entry in _verified.items()
+            if now - entry["verified_at"] < VERIFIED_TTL
+        }
+    try:
+        _write_private(VERIFIED_CACHE, _json_dumps(current))
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def mark_verified(doc: dict) -> None:
+    """Record that a doc's page 1 has content, as of its ``date_updated``."""
+    with _verified_lock:
+        _verified[doc["id"]] = {
+            "verified_at": time.time(),
+            "date_updated": doc.get("date_updated"),
+        }
+
+
+def recently_verified(doc: dict) -> bool:
+    """True if the doc was verified OK within the TTL and is unchanged since.
+
+    Only meaningful against a live listing: a cached one could predate the
+    change (main() fetches it live whenever this is used). A doc without
+    ``date_updated`` never counts as verified.
+    """
+    entry = _verified.get(doc.get("id"))
+    return (
+        entry is not None
+        and doc.get("date_updated") is not None
+        and time.time() - entry["verified_at"] < VERIFIED_TTL
+        and entry["date_updated"] == doc.get("date_updated")
+    )
+
+
 def get_doc_pages(token: str, doc_id: str) -> list[dict]:
-    """Get page listing for a doc."""
-    url = f"{CLICKUP_BASE}/docs/{doc_id}/page_listing"
-    resp = requests.get(url, headers=api_headers(token), timeout=30)
-    resp.raise_for_status()
-    data = resp.json()
+    """Get a doc's pages with their content inline.
+
+    Uses the pages endpoint rather than ``page_listing``, so deciding
+    whether a doc needs fixing usually takes this one call.
+    """
+    data = _json_loads(cached_get(
+        token,
+        f"{CLICKUP_BASE}/docs/{doc_id}/pages",
+        params={"content_format": "text/md"},
+    ))
     if isinstance(data, list):
         return data
     return data.get("pages", [])
 
 
+# Size fields a page-listing entry may carry; zero means the page is empty
+PAGE_SIZE_HINTS = ("word_count", "content_length", "size")
+
+
+def page_known_blank(page: dict) -> bool:
+    """Whether a page-listing entry already shows that the page is empty.
+
+    Only an explicit zero counts. A page with no hint, or a non-zero one
+    (it may still be whitespace), has to be fetched to be sure.
+    """
+    return any(page.get(key) == 0 for key in PAGE_SIZE_HINTS)
+
+
 def get_page_content(token: str, doc_id: str, page_id: str) -> dict:
     """Get full page content."""
-    url = f"{CLICKUP_BASE}/docs/{doc_id}/pages/{page_id}"
-    resp = requests.get(url, headers=api_headers(token), timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return _json_loads(cached_get(token, f"{CLICKUP_BASE}/docs/{doc_id}/pages/{page_id}"))
+
+
+def page_detail(token: str, doc_id: str, page: dict) -> dict:
+    """A page's content and name, fetched only if its listing entry lacks them."""
+    if "content" in page:
+        return page
+    if page_known_blank(page):
+        return {}
+    return get_page_content(token, doc_id, page["id"])
 
 
 def edit_page(token: str, doc_id: str, page_id: str, name: str, content: str) -> None:
     """Edit a page's content via PUT."""
+    _clickup_limiter.acquire()
     url = f"{CLICKUP_BASE}/docs/{doc_id}/pages/{page_id}"
     payload = {
         "name": name,
@@ -142,12 +635,13 @@ def edit_page(token: str, doc_id: str, page_id: str, name: str, content: str) ->
         "content_format": "text/md",
         "content_edit_mode": "replace",
     }
-    resp = requests.put(url, headers=api_headers(token), json=payload, timeout=30)
+    resp = _clickup_session.put(url, headers=api_headers(token), data=_json_dumps(payload), timeout=30)
     resp.raise_for_status()
 
 
 def clear_page(token: str, doc_id: str, page_id: str) -> None:
     """Clear a page's content (ClickUp Pages API does not support DELETE)."""
+    _clickup_limiter.acquire()
     url = f"{CLICKUP_BASE}/docs/{doc_id}/pages/{page_id}"
     payload = {
         "name": "(duplicate - see page 1)",
@@ -155,7 +649,7 @@ def clear_page(token: str, doc_id: str, page_id: str) -> None:
         "content_format": "text/md",
         "content_edit_mode": "replace",
     }
-    resp = requests.put(url, headers=api_headers(token), json=payload, timeout=30)
+    resp = _clickup_session.put(url, headers=api_headers(token), data=_json_dumps(payload), timeout=30)
     resp.raise_for_status()
 
 
@@ -163,27 +657,52 @@ def clear_page(token: str, doc_id: str, page_id: str) -> None:
 # Google Drive helpers (for --refill-from-drive)
 # ---------------------------------------------------------------------------
 
-def get_google_access_token() -> str:
-    """Get a Google OAuth2 access token from gcloud ADC credentials."""
+_google_token: dict = {}
+_google_token_lock = threading.Lock()
+
+
+def get_google_access_token(stale: str | None = None) -> str:
+    """Get a Google OAuth2 access token, refreshing only when needed.
+
+    The token is cached in memory (match backfill-standup-notes.py). Drive
+    calls ask for it per request, so a long run refreshes it near expiry.
+    Pass ``stale`` with a token the API rejected to force a refresh,
+    unless another thread has already replaced it.
+    """
+    with _google_token_lock:
+        token = _google_token.get("access_token")
+        expires_at = _google_token.get("expires_at", 0)
+        if token and token != stale and expires_at - time.time() > TOKEN_EXPIRY_MARGIN:
+            return token
+
+        _google_token.update(_refresh_google_token())
+        return _google_token["access_token"]
+
+
+def _refresh_google_token() -> dict:
+    """Exchange the gcloud ADC refresh token for a new access token."""
     if not ADC_FILE.exists():
-        print(
+        log.error(
             f"ERROR: No credentials found at {ADC_FILE}\n"
             "Run: gcloud auth application-default login --no-browser "
             "--scopes=https://www.googleapis.com/auth/drive.readonly,"
             "https://www.googleapis.com/auth/cloud-platform",
-            file=sys.stderr,
         )
         sys.exit(1)
 
-    adc = json.loads(ADC_FILE.read_text())
-    resp = requests.post(TOKEN_URL, data={
+    adc = _json_loads(ADC_FILE.read_bytes())
+    resp = _drive_session.post(TOKEN_URL, data={
         "client_id": adc["client_id"],
         "client_secret": adc["client_secret"],
         "refresh_token": adc["refresh_token"],
         "grant_type": "refresh_token",
     }, timeout=15)
     resp.raise_for_status()
-    return resp.json()["access_token"]
+    data = _json_loads(resp.content)
+    return {
+        "access_token": data["access_token"],
+        "expires_at": time.time() + data.get("expires_in", 3600),
+    }
 
 
 def _drive_headers(access_token: str) -> dict[str, str]:
@@ -193,15 +712,59 @@ def _drive_headers(access_token: str) -> dict[str, str]:
     }
 
 
-def list_drive_docs(access_token: str) -> list[dict]:
-    """List all standup Google Docs from the Drive folder."""
-    query = (
+def _drive_request(
+    method: str,
+    url: str,
+    headers: dict[str, str] | None = None,
+    **kwargs,
+) -> requests.Response:
+    """Call a Drive API URL, refreshing the access token once on a 401."""
+    access_token = get_google_access_token()
+    resp = _drive_session.request(
+        method, url, headers={**_drive_headers(access_token), **(headers or {})}, **kwargs,
+    )
+    if resp.status_code == 401:
+        # Release the connection first; with stream=True it is still held
+        resp.close()
+        access_token = get_google_access_token(stale=access_token)
+        resp = _drive_session.request(
+            method, url, headers={**_drive_headers(access_token), **(headers or {})}, **kwargs,
+        )
+    if not resp.ok:
+        _ = resp.content  # Buffer the error body (releasing the connection) for report_error
+        resp.raise_for_status()
+    return resp
+
+
+def _drive_get(url: str, **kwargs) -> requests.Response:
+    return _drive_request("GET", url, **kwargs)
+
+
+def _drive_standup_query() -> str:
+    return (
         f"'{DRIVE_FOLDER_ID}' in parents"
         " and mimeType='application/vnd.google-apps.document'"
         f" and name contains '{DRIVE_NAME_FILTER}'"
         " and trashed=false"
     )
-    headers = _drive_headers(access_token)
+
+
+def _parse_created_times(files: list[dict]) -> list[dict]:
+    """Parse each Drive file's createdTime once, into a "created" datetime."""
+    for f in files:
+        f["created"] = datetime.fromisoformat(f["createdTime"].replace("Z", "+00:00"))
+    return files
+
+
+def list_drive_docs(since: str | None = None) -> list[dict]:
+    """List standup Google Docs from the Drive folder.
+
+    ``since`` (an ISO date) limits the listing to docs created on or after
+    that UTC day, so Drive filters out older docs server-side.
+    """
+    query = _drive_standup_query()
+    if since:
+        query += f" and createdTime >= '{since}T00:00:00'"
     docs: list[dict] = []
     page_token = None
 
@@ -209,18 +772,19 @@ def list_drive_docs(access_token: str) -> list[dict]:
         params: dict[str, object] = {
             "q": query,
             "fields": "nextPageToken, files(id, name, createdTime)",
-            "pageSize": 100,
+            "pageSize": 1000,  # Drive's maximum, to minimise round-trips
+            # Oldest first, so the index keeps the latest doc for each date
             "orderBy": "createdTime",
+            # Without these, a folder on a shared drive lists as empty
+            "supportsAllDrives": "true",
+            "includeItemsFromAllDrives": "true",
         }
         if page_token:
             params["pageToken"] = page_token
 
-        resp = requests.get(
-            f"{DRIVE_API}/files", headers=headers, params=params, timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        docs.extend(data.get("files", []))
+        resp = _drive_get(f"{DRIVE_API}/files", params=params, timeout=30)
+        data = _json_loads(resp.content)
+        docs.extend(_parse_created_times(data.get("files", [])))
         page_token = data.get("nextPageToken")
         if not page_token:
             break
@@ -228,37 +792,137 @@ def list_drive_docs(access_token: str) -> list[dict]:
     return docs
 
 
-def export_doc_as_text(access_token: str, doc_id: str) -> str:
+@functools.lru_cache(maxsize=None)
+def find_drive_doc_by_date(iso_date: str) -> dict | None:
+    """Find the latest standup doc created in Drive on a UTC date.
+
+    One single-result query per date, so a run that refills a few docs
+    does not list the whole folder. Returns None if there is none.
+    """
+    next_day = (date.fromisoformat(iso_date) + timedelta(days=1)).isoformat()
+    query = (
+        _drive_standup_query()
+        + f" and createdTime >= '{iso_date}T00:00:00'"
+        + f" and createdTime < '{next_day}T00:00:00'"
+    )
+    resp = _drive_get(
+        f"{DRIVE_API}/files",
+        params={
+            "q": query,
+            "fields": "files(id, name, createdTime)",
+            "pageSize": 1,
+            # Latest first, matching the index's last-one-wins per date
+            "orderBy": "createdTime desc",
+            "supportsAllDrives": "true",
+            "includeItemsFromAllDrives": "true",
+        },
+        timeout=30,
+    )
+    files = _parse_created_times(_json_loads(resp.content).get("files", []))
+    return files[0] if files else None
+
+
+def export_doc_as_text(doc_id: str) -> str:
     """Export a Google Doc as plain text."""
-    resp = requests.get(
+    resp = _drive_get(
         f"{DRIVE_API}/files/{doc_id}/export",
-        headers=_drive_headers(access_token),
         params={"mimeType": "text/plain"},
         timeout=30,
+        stream=True,
     )
-    resp.raise_for_status()
-    return resp.text
+    # Decode chunks as they arrive, so the whole body is never held as bytes
+    # next to its decoded copy (match backfill-standup-notes.py)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with resp:
+        parts = [decoder.decode(chunk) for chunk in resp.iter_content(EXPORT_CHUNK_SIZE)]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
 
 
-def format_doc_content(file_name: str, created_time: str, text_content: str) -> tuple[str, str]:
+def export_docs_batch(doc_ids: list[str]) -> dict[str, str]:
+    """Export up to ``DRIVE_BATCH_SIZE`` Google Docs in one batch request.
+
+    Returns ``{doc_id: text}`` for the parts that succeeded; callers export
+    any missing IDs one by one (match backfill-standup-notes.py).
+    """
+    boundary = "batch_standup_fix"
+    parts = [
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <{doc_id}>\r\n"
+        "\r\n"
+        f"GET /drive/v3/files/{doc_id}/export?mimeType=text%2Fplain\r\n"
+        "\r\n"
+        for doc_id in doc_ids
+    ]
+    body = "".join(parts) + f"--{boundary}--\r\n"
+
+    resp = _drive_request(
+        "POST",
+        DRIVE_BATCH_URL,
+        headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        data=body.encode(),
+        timeout=60,
+    )
+
+    # Let the email parser split the multipart body on its boundary
+    message = email.message_from_bytes(
+        f"Content-Type: {resp.headers['Content-Type']}\r\n\r\n".encode()
+        + resp.content
+    )
+    texts: dict[str, str] = {}
+    for part in message.get_payload():
+        content_id = (part.get("Content-ID") or "").strip("<>")
+        doc_id = content_id.removeprefix("response-")
+        # Each part is a raw HTTP response: status line, headers, body
+        raw = part.get_payload(decode=True)
+        head, _, payload = raw.partition(b"\r\n\r\n")
+        status_line = head.split(b"\r\n", 1)[0].split()
+        if doc_id in doc_ids and len(status_line) > 1 and status_line[1] == b"200":
+            texts[doc_id] = payload.decode("utf-8")
+    return texts
+
+
+def prefetch_drive_texts(doc_ids: list[str]) -> dict[str, str]:
+    """Batch-export the Drive docs that refills will need.
+
+    Best effort: the first failed or empty batch stops batching, and
+    refill_page1 exports whatever is missing on its own.
+    """
+    texts: dict[str, str] = {}
+    for start in range(0, len(doc_ids), DRIVE_BATCH_SIZE):
+        try:
+            batch = export_docs_batch(doc_ids[start:start + DRIVE_BATCH_SIZE])
+        except Exception as e:
+            log.warning(f"  Batch export failed, exporting individually: {e}")
+            break
+        if not batch:
+            # Answered, but no export succeeded: media is not served
+            # through batch here
+            log.warning("  Batch export returned no docs, exporting individually")
+            break
+        texts.update(batch)
+    return texts
+
+
+def format_doc_content(file_name: str, created: datetime, text_content: str) -> tuple[str, str]:
     """Format content matching the n8n workflow output.
 
     Returns (doc_name, content).
     """
-    dt = datetime.fromisoformat(created_time.replace("Z", "+00:00"))
-    iso_date = dt.strftime("%Y-%m-%d")
-    display_date = dt.strftime("%A, %B %-d, %Y")
-    doc_name = f"Daily Standup \u2014 {iso_date}"
-    content = "\n".join([
-        f"# {doc_name}",
-        "",
-        f"**Source:** {file_name}",
-        f"**Date:** {display_date}",
-        "",
-        "---",
-        "",
-        text_content,
-    ])
+    doc_name = f"Daily Standup \u2014 {created:%Y-%m-%d}"
+    # created.day rather than "%-d", which is glibc-only and fails on Windows
+    display_date = f"{created:%A, %B} {created.day}, {created.year}"
+    content = (
+        f"# {doc_name}\n"
+        "\n"
+        f"**Source:** {file_name}\n"
+        f"**Date:** {display_date}\n"
+        "\n"
+        "---\n"
+        "\n"
+        f"{text_content}"
+    )
     return doc_name, content
 
 
@@ -267,20 +931,147 @@ def build_drive_date_index(drive_docs: list[dict]) -> dict[str, dict]:
 
     Returns {iso_date: drive_doc} for O(1) lookup.
     """
-    index: dict[str, dict] = {}
-    for doc in drive_docs:
-        dt = datetime.fromisoformat(doc["createdTime"].replace("Z", "+00:00"))
-        iso_date = dt.strftime("%Y-%m-%d")
-        index[iso_date] = doc
-    return index
+    return {doc["created"].strftime("%Y-%m-%d"): doc for doc in drive_docs}
+
+
+DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
 
 
 def extract_date_from_name(name: str) -> str | None:
     """Extract ISO date from a ClickUp doc name like 'Daily Standup — 2026-02-25'."""
-    match = re.search(r"(\d{4}-\d{2}-\d{2})", name)
+    match = DATE_RE.search(name)
     return match.group(1) if match else None
 
 
+class PlanAction(enum.Enum):
+    """What ``inspect_doc()`` found a doc needs."""
+
+    ALREADY_OK = "already_ok"
+    COPY_PAGE2 = "copy_page2"
+    REFILL_FROM_DRIVE = "refill_from_drive"
+    ERROR = "error"
+
+
+def inspect_doc(
+    token: str,
+    doc: dict,
+    args: argparse.Namespace,
+    find_drive_doc: Callable[[str], dict | None],
+) -> tuple[PlanAction, functools.partial | None]:
+    """Work out what a doc needs, using read-only calls.
+
+    ``find_drive_doc`` maps an ISO date to its Drive doc (or None). Returns
+    the action and the write that carries it out, or None when there is
+    nothing to write (including on a dry run).
+    """
+    doc_id = doc.get("id", "unknown")
+    doc_name = doc.get("name", "unknown")
+
+    pages = get_doc_pages(token, doc_id)
+    if not pages:
+        log.info(f"  [{doc_name}] No pages found — skipping")
+        return PlanAction.ERROR, None
+
+    page1 = pages[0]
+    page1_id = page1["id"]
+
+    page1_content = page_detail(token, doc_id, page1).get("content") or ""
+
+    if page1_content and page1_content.strip():
+        mark_verified(doc)
+        return PlanAction.ALREADY_OK, None
+
+    # Page 1 is blank — check page 2 if it exists
+    if len(pages) >= 2:
+        page2 = pages[1]
+        page2_id = page2["id"]
+        page2_detail = page_detail(token, doc_id, page2)
+        page2_content = page2_detail.get("content") or ""
+        page2_name = page2_detail.get("name", doc_name)
+
+        if page2_content and page2_content.strip():
+            # Page 2 has content → copy to page 1
+            log.info(f"  [{doc_name}] Page 1 blank, page 2 has content ({len(page2_content)} chars)")
+            if args.dry_run:
+                log.info(f"  [{doc_name}] DRY RUN: Would copy page 2 → page 1, then clear page 2")
+                return PlanAction.COPY_PAGE2, None
+            return PlanAction.COPY_PAGE2, functools.partial(
+                move_page2_to_page1, token, doc_id, doc_name,
+                page1_id, page2_id, page2_name, page2_content,
+            )
+
+    # Both pages empty (or only 1 page) — try refill from Drive
+    if not args.refill_from_drive:
+        log.info(f"  [{doc_name}] All pages empty — use --refill-from-drive to populate")
+        return PlanAction.ALREADY_OK, None
+
+    doc_date = extract_date_from_name(doc_name)
+    drive_doc = find_drive_doc(doc_date) if doc_date else None
+    if not drive_doc:
+        log.info(f"  [{doc_name}] No matching Google Drive doc found for date {doc_date}")
+        return PlanAction.ERROR, None
+
+    log.info(f"  [{doc_name}] Refilling from Google Drive: {drive_doc['name']}")
+
+    if args.dry_run:
+        log.info(f"  [{doc_name}] DRY RUN: Would fetch and write content from Drive")
+        return PlanAction.REFILL_FROM_DRIVE, None
+    return PlanAction.REFILL_FROM_DRIVE, functools.partial(
+        refill_page1, token, doc_id, doc_name,
+        page1_id, drive_doc=drive_doc,
+    )
+
+
+def move_page2_to_page1(
+    token: str,
+    doc_id: str,
+    doc_name: str,
+    page1_id: str,
+    page2_id: str,
+    name: str,
+    content: str,
+) -> None:
+    """Copy page 2's content onto page 1, then clear page 2.
+
+    Page 2 is only cleared once page 1 holds the copy, so a failure in
+    between leaves the content in both places rather than in neither.
+    """
+    edit_page(token, doc_id, page1_id, name, content)
+    log.info(f"  [{doc_name}] Copied content to page 1 ({page1_id})")
+
+    clear_page(token, doc_id, page2_id)
+    log.info(f"  [{doc_name}] Cleared page 2 ({page2_id})")
+
+
+def refill_page1(
+    token: str,
+    doc_id: str,
+    doc_name: str,
+    page1_id: str,
+    drive_doc: dict,
+    text: str | None = None,
+) -> None:
+    """Write a Drive doc's formatted content to page 1.
+
+    ``text`` is the doc's already exported content, if any; otherwise the
+    doc is exported here.
+    """
+    if text is None:
+        text = export_doc_as_text(drive_doc["id"])
+    _, content = format_doc_content(
+        drive_doc["name"], drive_doc["created"], text,
+    )
+
+    edit_page(token, doc_id, page1_id, doc_name, content)
+    log.info(f"  [{doc_name}] Wrote {len(content)} chars to page 1 ({page1_id})")
+
+
+def report_error(doc_name: str, e: Exception) -> None:
+    log.error(f"  [{doc_name}] ERROR: {e}")
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        log.error(f"    Response: {e.response.text[:300]}")
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(
         description="Fix existing standup docs with blank default pages.",
@@ -295,169 +1086,196 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="When both pages are empty, re-fetch content from Google Drive.",
     )
-    return p.parse_args()
+    p.add_argument(
+        "--prefetch-drive-index",
+        action="store_true",
+        help=(
+            "With --refill-from-drive, list the whole Drive folder up front instead "
+            "of looking up each date on demand (faster when most docs need a refill)."
+        ),
+    )
+    p.add_argument(
+        "--refresh-listing",
+        action="store_true",
+        help=(
+            "With --recheck, re-fetch the ClickUp folder listing instead of reusing "
+            f"the copy cached for up to {LISTING_CACHE_TTL // 60} min (dry runs reuse it "
+            "at any age). Without --recheck the listing is always fetched live."
+        ),
+    )
+    p.add_argument(
+        "--recheck",
+        action="store_true",
+        help=(
+            "Inspect every doc, including those verified OK in the last "
+            f"{VERIFIED_TTL // 3600}h and unchanged since."
+        ),
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=(
+            "Docs inspected, then fixed, concurrently; 1 handles them one at a "
+            f"time. The rate limit is shared by all workers (default: {MAX_WORKERS})"
+        ),
+    )
+    args = p.parse_args()
+    if args.workers < 1:
+        p.error("--workers must be at least 1")
+    return args
 
 
 def main() -> None:
     args = parse_args()
+    configure_logging()
 
-    print("Retrieving ClickUp API token...")
+    log.info("Retrieving ClickUp API token...")
     token = get_clickup_token()
 
-    # --- Optionally load Google Drive index ---
-    drive_index: dict[str, dict] = {}
-    google_token = ""
-    if args.refill_from_drive:
-        print("Authenticating to Google Drive...")
-        google_token = get_google_access_token()
-        print("Listing Google Drive standup docs...")
-        drive_docs = list_drive_docs(google_token)
-        drive_index = build_drive_date_index(drive_docs)
-        print(f"Found {len(drive_docs)} Google Drive doc(s) ({len(drive_index)} unique dates).")
-
-    print(f"Listing docs in folder {FOLDER_ID}...")
-    docs = list_docs(token)
-    print(f"Found {len(docs)} doc(s).")
+    log.info(f"Listing docs in folder {FOLDER_ID}...")
+    # Skipping verified docs needs current date_updated values, so the
+    # listing is fetched live (one ETag revalidation) unless --recheck
+    docs = list_docs_cached(
+        token,
+        refresh=args.refresh_listing or not args.recheck,
+        allow_stale=args.dry_run,
+    )
+    log.info(f"Found {len(docs)} doc(s).")
 
     if not docs:
-        print("No docs found. Nothing to do.")
+        log.info("No docs found. Nothing to do.")
         return
 
+    # --- Google Drive lookup (only for --refill-from-drive) ---
+    drive_index: dict[str, dict] = {}
+    find_drive_doc = drive_index.get
+    if args.refill_from_drive:
+        log.info("Authenticating to Google Drive...")
+        get_google_access_token()  # Fail before inspecting if ADC is missing
+        # Each refill looks up its own date unless the index is prefetched
+        find_drive_doc = find_drive_doc_by_date
+    if args.refill_from_drive and args.prefetch_drive_index:
+        # Nothing older than the earliest ClickUp doc can be matched to one
+        doc_dates = filter(None, (extract_date_from_name(d.get("name", "")) for d in docs))
+        since = min(doc_dates, default=None)
+        log.info("Listing Google Drive standup docs" + (f" created since {since}..." if since else "..."))
+        drive_docs = list_drive_docs(since)
+        drive_index = build_drive_date_index(drive_docs)
+        log.info(f"Found {len(drive_docs)} Google Drive doc(s) ({len(drive_index)} unique dates).")
+        find_drive_doc = drive_index.get
+
     # --- Identify duplicates ---
-    by_name: dict[str, list[dict]] = {}
+    by_name: defaultdict[str, list[dict]] = defaultdict(list)
     for doc in docs:
-        by_name.setdefault(doc["name"], []).append(doc)
+        by_name[doc["name"]].append(doc)
 
     duplicates = {name: entries for name, entries in by_name.items() if len(entries) > 1}
     if duplicates:
-        print(f"\n{'=' * 50}")
-        print(f"DUPLICATE DOCS ({len(duplicates)} names with multiple docs):")
+        log.info(f"{'=' * 50}")
+        log.info(f"DUPLICATE DOCS ({len(duplicates)} names with multiple docs):")
         for name, entries in sorted(duplicates.items()):
-            print(f"  {name}:")
+            log.info(f"  {name}:")
             for entry in entries:
                 doc_id = entry.get("id", "unknown")
-                print(f"    - id: {doc_id}")
-        print(f"{'=' * 50}")
-        print("Known duplicates to delete (from folder 7080):")
-        for date, ids in sorted(KNOWN_DUPLICATES.items()):
-            print(f"  {date}: delete {ids['duplicate']}, keep {ids['original']}")
-        print()
+                log.info(f"    - id: {doc_id}")
+        log.info(f"{'=' * 50}")
+        log.info("Known duplicates to delete (from folder 7080):")
+        for dup_date, ids in sorted(KNOWN_DUPLICATES.items()):
+            log.info(f"  {dup_date}: delete {ids['duplicate']}, keep {ids['original']}")
 
     # --- Fix blank default pages ---
-    fixed = 0
-    refilled = 0
-    already_ok = 0
-    errors = 0
-
-    dup_ids = {v["duplicate"] for v in KNOWN_DUPLICATES.values()}
+    counts = dict.fromkeys(PlanAction, 0)
 
+    # Known duplicates stay for manual deletion (the ClickUp API has no doc
+    # DELETE), so drop them before any per-doc requests are made
     for doc in docs:
-        doc_id = doc.get("id", "unknown")
-        doc_name = doc.get("name", "unknown")
-
-        # Skip known duplicates
-        if doc_id in dup_ids:
-            print(f"  [{doc_name}] Skipping known duplicate {doc_id}")
-            continue
-
-        try:
-            time.sleep(RATE_LIMIT_DELAY)
-            pages = get_doc_pages(token, doc_id)
-
-            if not pages:
-                print(f"  [{doc_name}] No pages found — skipping")
-                errors += 1
-                continue
-
-            page1 = pages[0]
-            page1_id = page1["id"]
-
-            # Check page 1 content
-            time.sleep(RATE_LIMIT_DELAY)
-            page1_detail = get_page_content(token, doc_id, page1_id)
-            page1_content = page1_detail.get("content", "")
-
-            if page1_content and page1_content.strip():
-                already_ok += 1
-                continue
-
-            # Page 1 is blank — check page 2 if it exists
-            if len(pages) >= 2:
-                page2 = pages[1]
-                page2_id = page2["id"]
-                time.sleep(RATE_LIMIT_DELAY)
-                page2_detail = get_page_content(token, doc_id, page2_id)
-                page2_content = page2_detail.get("content", "")
-                page2_name = page2_detail.get("name", doc_name)
-
-                if page2_content and page2_content.strip():
-                    # Page 2 has content → copy to page 1
-                    print(f"  [{doc_name}] Page 1 blank, page 2 has content ({len(page2_content)} chars)")
-                    if args.dry_run:
-                        print(f"    DRY RUN: Would copy page 2 → page 1, then clear page 2")
-                        fixed += 1
-                        continue
-
-                    time.sleep(RATE_LIMIT_DELAY)
-                    edit_page(token, doc_id, page1_id, page2_name, page2_content)
-                    print(f"    Copied content to page 1 ({page1_id})")
-
-                    time.sleep(RATE_LIMIT_DELAY)
-                    clear_page(token, doc_id, page2_id)
-                    print(f"    Cleared page 2 ({page2_id})")
-                    fixed += 1
-                    continue
-
-            # Both pages empty (or only 1 page) — try refill from Drive
-            if not args.refill_from_drive:
-                print(f"  [{doc_name}] All pages empty — use --refill-from-drive to populate")
-                already_ok += 1
-                continue
-
-            doc_date = extract_date_from_name(doc_name)
-            if not doc_date or doc_date not in drive_index:
-                print(f"  [{doc_name}] No matching Google Drive doc found for date {doc_date}")
-                errors += 1
-                continue
-
-            drive_doc = drive_index[doc_date]
-            print(f"  [{doc_name}] Refilling from Google Drive: {drive_doc['name']}")
-
-            if args.dry_run:
-                print(f"    DRY RUN: Would fetch and write content from Drive")
-                refilled += 1
+        if doc.get("id") in KNOWN_DUPLICATE_IDS:
+            log.info(f"  [{doc.get('name', 'unknown')}] Skipping known duplicate {doc['id']}")
+    docs = [doc for doc in docs if doc.get("id") not in KNOWN_DUPLICATE_IDS]
+
+    load_verified()
+    if not args.recheck:
+        unchecked = [doc for doc in docs if not recently_verified(doc)]
+        if len(unchecked) < len(docs):
+            skipped = len(docs) - len(unchecked)
+            log.info(f"Skipping {skipped} doc(s) verified OK in the last {VERIFIED_TTL // 3600}h (--recheck to inspect)")
+            counts[PlanAction.ALREADY_OK] += skipped
+            docs = unchecked
+
+    _clickup_session.mount("https://", _make_adapter(args.workers, _ClickUpRetry))
+    _drive_session.mount("https://", _make_adapter(args.workers))
+
+    # (plan, doc name, write) for each fix, applied after inspection
+    writes: list[tuple[PlanAction, str, functools.partial]] = []
+
+    # Docs are inspected concurrently; the limiter still paces the total
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(inspect_doc, token, doc, args, find_drive_doc): doc
+            for doc in docs
+        }
+        for future in as_completed(futures):
+            doc_name = futures[future].get("name", "unknown")
+            try:
+                plan, write = future.result()
+            except Exception as e:
+                report_error(doc_name, e)
+                counts[PlanAction.ERROR] += 1
                 continue
 
-            text = export_doc_as_text(google_token, drive_doc["id"])
-            _, content = format_doc_content(
-                drive_doc["name"], drive_doc["createdTime"], text,
-            )
-
-            time.sleep(RATE_LIMIT_DELAY)
-            edit_page(token, doc_id, page1_id, doc_name, content)
-            print(f"    Wrote {len(content)} chars to page 1 ({page1_id})")
-            refilled += 1
-
-        except requests.HTTPError as e:
-            print(f"  [{doc_name}] ERROR: {e}", file=sys.stderr)
-            if e.response is not None:
-                print(f"    Response: {e.response.text[:300]}", file=sys.stderr)
-            errors += 1
-
-        except Exception as e:
-            print(f"  [{doc_name}] ERROR: {e}", file=sys.stderr)
-            errors += 1
+            if write is not None:
+                writes.append((plan, doc_name, write))
+            else:
+                counts[plan] += 1
+
+    # --- Export refill content from Drive, batched ---
+    refill_ids = [
+        write.keywords["drive_doc"]["id"]
+        for plan, _, write in writes
+        if plan is PlanAction.REFILL_FROM_DRIVE
+    ]
+    if len(refill_ids) > 1:
+        log.info(f"Exporting {len(refill_ids)} Google Drive doc(s)...")
+        texts = prefetch_drive_texts(refill_ids)
+        writes = [
+            (plan, doc_name, functools.partial(
+                write, text=texts.get(write.keywords["drive_doc"]["id"]),
+            ))
+            if plan is PlanAction.REFILL_FROM_DRIVE else (plan, doc_name, write)
+            for plan, doc_name, write in writes
+        ]
+
+    # --- Apply fixes ---
+    # Each doc's writes stay in order; separate docs overlap their round
+    # trips while the limiter paces the total
+    if writes:
+        log.info(f"Applying {len(writes)} fix(es)...")
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(write): (plan, doc_name)
+            for plan, doc_name, write in writes
+        }
+        for future in as_completed(futures):
+            plan, doc_name = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                report_error(doc_name, e)
+                counts[PlanAction.ERROR] += 1
+            else:
+                counts[plan] += 1
 
     # --- Summary ---
-    print(f"\n{'=' * 40}")
+    log.info(f"{'=' * 40}")
     action = "Would fix" if args.dry_run else "Fixed"
     refill_action = "Would refill" if args.dry_run else "Refilled"
-    print(f"{action}:       {fixed}")
-    print(f"{refill_action}:    {refilled}")
-    print(f"Already OK:   {already_ok}")
-    print(f"Errors:       {errors}")
+    log.info(f"{action}:       {counts[PlanAction.COPY_PAGE2]}")
+    log.info(f"{refill_action}:    {counts[PlanAction.REFILL_FROM_DRIVE]}")
+    log.info(f"Already OK:   {counts[PlanAction.ALREADY_OK]}")
+    log.info(f"Errors:       {counts[PlanAction.ERROR]}")
     if duplicates:
-        print(f"Duplicates:   {len(duplicates)} name(s) — delete manually in ClickUp UI")
+        log.info(f"Duplicates:   {len(duplicates)} name(s) — delete manually in ClickUp UI")
 
 
 if __name__ == "__main__":